@@ -1,14 +1,18 @@
+import asyncio
 import collections
+import concurrent.futures
 import json
 import sys
 import time
-from typing import Dict, List, Type
+from typing import Dict, List, Optional, Type
 
 import statsd
 from loguru import logger
 
 from iocingestor import config, exceptions, state
+from iocingestor.scheduler import Scheduler
 from iocingestor.artifacts import Artifact
+from iocingestor.sources import Source, pool, stream_run
 from iocingestor.whitelists import Whitelist
 
 try:
@@ -24,6 +28,11 @@ class Ingestor:
 
     Handles reading the config file, calling sources, maintaining state, and
     sending artifacts to operators.
+
+    Each run is driven by an asyncio event loop on the calling thread. Plugins
+    with an ``async def run`` (sources) or ``async def process_batch``
+    (operators) are awaited natively; plain synchronous sources are run on the
+    source worker pool.
     """
 
     def __init__(self, config_file: str):
@@ -88,6 +97,33 @@ class Ingestor:
             logger.exception("Error loading whitelists")
             sys.exit(1)
 
+        # Set up the worker pool used to run synchronous sources concurrently.
+        try:
+            self.executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.config.max_source_workers()
+            )
+        except (TypeError, ValueError):
+            logger.exception("Couldn't initialize source workers; bad config?")
+            sys.exit(1)
+
+        # Set up the process pool used for IOC extraction, if any.
+        try:
+            pool.configure(self.config.extraction_processes())
+        except (TypeError, ValueError):
+            logger.exception("Couldn't initialize extraction pool; bad config?")
+            sys.exit(1)
+
+        # Schedule each source on its own interval.
+        self.scheduler = Scheduler()
+        schedules = self.config.schedules()
+        for name in self.sources:
+            interval, jitter = schedules.get(name, (self.config.sleep(), 0))
+            self.scheduler.add(name, interval, jitter)
+
+        self.loop = asyncio.new_event_loop()
+        self.batch_size = self.config.artifact_batch_size()
+        self.max_pending_batches = self.config.max_pending_batches()
+
     def _contains_in_whitelist(self, artifact: Type[Artifact]) -> bool:
         if self.whitelist.contains(str(artifact)):
             logger.debug(
@@ -106,69 +142,177 @@ class Ingestor:
             with self.statsd.timer("run_once"):
                 self.run_once()
 
-    def run_once(self):
-        """Run each source once, passing artifacts to each operator."""
-        # Track some statistics about artifacts in a summary object.
-        summary = collections.Counter()
+    def _put(self, queue: asyncio.Queue, event: tuple):
+        """Put an event on the run queue from a worker thread, blocking while it is full."""
+        asyncio.run_coroutine_threadsafe(queue.put(event), self.loop).result()
+
+    def _stream_source(
+        self, source: str, saved_state: Optional[str], queue: asyncio.Queue
+    ) -> Optional[str]:
+        """Run a single synchronous source, handing its artifacts over in batches.
+
+        Called from the source worker pool, so it must not touch the state DB.
+        Returns the new saved state.
+        """
+        logger.debug(f"Running source '{source}'")
+        plugin = self.sources[source]
+        with self.statsd.timer(f"source.{source}"):
+            artifacts = (
+                plugin.iter_artifacts(saved_state)
+                if isinstance(plugin, Source)
+                else stream_run(plugin, saved_state)
+            )
 
-        for source in self.sources:
-            # Run the source to collect artifacts.
-            logger.debug(f"Running source '{source}'")
-            try:
+            batch: List[Artifact] = []
+            while True:
+                try:
+                    batch.append(next(artifacts))
+                except StopIteration as stop:
+                    saved_state = stop.value
+                    break
+
+                if len(batch) >= self.batch_size:
+                    self._put(queue, ("batch", source, batch))
+                    batch = []
+
+        # Always send the final batch, so every source reaches the operators.
+        self._put(queue, ("batch", source, batch))
+        return saved_state
+
+    async def _run_source_async(
+        self, source: str, saved_state: Optional[str], queue: asyncio.Queue
+    ):
+        """Run a single source, natively if it is async, else on the worker pool.
+
+        Artifacts are put on ``queue`` in batches, followed by a ``done`` event
+        carrying the new saved state, or an ``error`` event.
+        """
+        plugin = self.sources[source]
+        try:
+            if asyncio.iscoroutinefunction(plugin.run):
+                logger.debug(f"Running async source '{source}'")
                 with self.statsd.timer(f"source.{source}"):
-                    saved_state, artifacts = self.sources[source].run(
-                        self.statedb.get_state(source)
-                    )
+                    saved_state, artifacts = await plugin.run(saved_state)
+
+                for i in range(0, max(len(artifacts), 1), self.batch_size):
+                    batch = artifacts[i : i + self.batch_size]
+                    await queue.put(("batch", source, batch))
+
+            else:
+                saved_state = await asyncio.get_event_loop().run_in_executor(
+                    self.executor, self._stream_source, source, saved_state, queue
+                )
+
+        except Exception:
+            self.statsd.incr(f"error.source.{source}")
+            logger.exception(f"Unknown error in source '{source}'")
+            await queue.put(("error", source, None))
+            return
+
+        await queue.put(("done", source, saved_state))
+
+    async def _process_artifacts(
+        self, source: str, artifacts: List[Artifact], summary: collections.Counter
+    ):
+        """Filter a batch of artifacts from a source and pass it to each operator."""
+        # Reject whitelisted artifacts
+        artifacts = [
+            artifact
+            for artifact in artifacts
+            if not self._contains_in_whitelist(artifact)
+        ]
+
+        # Process artifacts with each operator.
+        for operator in self.operators:
+            logger.debug(
+                f"Processing {len(artifacts)} artifacts from source '{source}' with operator '{operator}'"
+            )
+            plugin = self.operators[operator]
+            try:
+                with self.statsd.timer(f"operator.{operator}"):
+                    if asyncio.iscoroutinefunction(
+                        getattr(plugin, "process_batch", None)
+                    ):
+                        await plugin.process_batch(plugin.filter_artifacts(artifacts))
+                    else:
+                        plugin.process(artifacts)
 
             except Exception:
-                self.statsd.incr(f"error.source.{source}")
-                logger.exception(f"Unknown error in source '{source}'")
+                self.statsd.incr(f"error.operator.{operator}")
+                logger.exception(f"Unknown error in operator '{operator}'")
                 continue
 
-            # Save the source state.
-            self.statedb.save_state(source, saved_state)
+        # Record stats and update the summary.
+        types = artifact_types(artifacts)
+        summary.update(types)
+        for artifact_type in types:
+            self.statsd.incr(f"source.{source}.{artifact_type}", types[artifact_type])
+            self.statsd.incr(f"artifacts.{artifact_type}", types[artifact_type])
+
+    async def run_once_async(self, sources: Optional[List[str]] = None):
+        """Run each source once, passing artifacts to each operator.
+
+        Runs the given source names, or all sources. They are started at once and hand their artifacts over in
+        batches through a bounded queue, so operators work while extraction is
+        still going on. Whitelisting, operators and state DB writes run on the
+        event loop. A source's state is saved once all its batches are done.
+        """
+        # Track some statistics about artifacts in a summary object.
+        summary = collections.Counter()
 
-            # Reject whitelisted artifacts
-            artifacts = [
-                artifact
-                for artifact in artifacts
-                if not self._contains_in_whitelist(artifact)
-            ]
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.max_pending_batches)
+        tasks = [
+            asyncio.ensure_future(
+                self._run_source_async(source, self.statedb.get_state(source), queue)
+            )
+            for source in (self.sources if sources is None else sources)
+        ]
 
-            # Process artifacts with each operator.
-            for operator in self.operators:
-                logger.debug(
-                    f"Processing {len(artifacts)} artifacts from source '{source}' with operator '{operator}'"
-                )
-                try:
-                    with self.statsd.timer(f"operator.{operator}"):
-                        self.operators[operator].process(artifacts)
-
-                except Exception:
-                    self.statsd.incr(f"error.operator.{operator}")
-                    logger.exception(f"Unknown error in operator '{operator}'")
-                    continue
-
-            # Record stats and update the summary.
-            types = artifact_types(artifacts)
-            summary.update(types)
-            for artifact_type in types:
-                self.statsd.incr(
-                    f"source.{source}.{artifact_type}", types[artifact_type]
-                )
-                self.statsd.incr(f"artifacts.{artifact_type}", types[artifact_type])
+        running = len(tasks)
+        while running:
+            event, source, payload = await queue.get()
+
+            if event == "batch":
+                await self._process_artifacts(source, payload, summary)
+                continue
+
+            if event == "done":
+                # Save the source state.
+                self.statedb.save_state(source, payload)
+
+            running -= 1
+
+        await asyncio.gather(*tasks)
 
         # Log the summary.
         logger.log("NOTIFY", f"New artifacts: {dict(summary)}")
 
-    def run_forever(self):
-        """Run forever, sleeping for the configured interval between each run."""
-        while True:
+    def run_once(self, sources: Optional[List[str]] = None):
+        """Run each source once, passing artifacts to each operator."""
+        self.loop.run_until_complete(self.run_once_async(sources))
+
+    def run_pending(self) -> float:
+        """Run the sources that are due, and return seconds until the next is due."""
+        due = self.scheduler.pop_due()
+        if due:
+            now = self.scheduler.timefunc()
+            for source, due_time in due:
+                self.statsd.timing(f"schedule.lag.{source}", (now - due_time) * 1000)
+
             with self.statsd.timer("run_once"):
-                self.run_once()
+                self.run_once([source for source, _ in due])
+
+            for source, due_time in due:
+                self.scheduler.reschedule(source, due_time)
+
+        return max(self.scheduler.next_due() - self.scheduler.timefunc(), 0)
 
-            logger.debug(f"Sleeping for {self.config.sleep()} seconds")
-            time.sleep(self.config.sleep())
+    def run_forever(self):
+        """Run forever, running each source whenever it is due."""
+        while True:
+            delay = self.run_pending()
+            logger.debug(f"Sleeping for {delay:.1f} seconds")
+            time.sleep(delay)
 
 
 def artifact_types(artifact_list: List[Artifact]) -> Dict[str, int]:
@@ -15,6 +15,12 @@ INTERNAL_OPTIONS = [
     "credentials",
 ]
 
+# Source options used by the Ingestor itself, not passed to plugins.
+SCHEDULE_OPTIONS = [
+    "interval",
+    "jitter",
+]
+
 ARTIFACT_TYPES = "artifact_types"
 FILTER_STRING = "filter"
 ALLOWED_SOURCES = "allowed_sources"
@@ -57,6 +63,22 @@ class Config:
         """Returns number of seconds to sleep between iterations, if daemonizing."""
         return self.config["general"]["sleep"]
 
+    def max_source_workers(self):
+        """Returns number of sources allowed to run concurrently."""
+        return self.config["general"].get("max_source_workers", 1)
+
+    def artifact_batch_size(self):
+        """Returns max number of artifacts handed from a source to operators at once."""
+        return self.config["general"].get("artifact_batch_size", 500)
+
+    def max_pending_batches(self):
+        """Returns max number of artifact batches waiting for operators."""
+        return self.config["general"].get("max_pending_batches", 8)
+
+    def extraction_processes(self):
+        """Returns number of worker processes for IOC extraction (0 runs in-process)."""
+        return self.config["general"].get("extraction_processes", 0)
+
     def statsd(self):
         """Returns statsd config dictionary."""
         return self.config.get("statsd", {})
@@ -87,6 +109,9 @@ class Config:
         for source in self.config["sources"]:
             kwargs = {}
             for key, value in source.items():
+                if key in SCHEDULE_OPTIONS:
+                    continue
+
                 if key not in INTERNAL_OPTIONS:
                     kwargs[key] = value
 
@@ -108,6 +133,19 @@ class Config:
         logger.debug(f"Found {len(sources)} total sources")
         return sources
 
+    def schedules(self):
+        """Return a dictionary of {source name: (interval, jitter)}.
+
+        Sources without an interval run every ``sleep`` seconds.
+        """
+        return {
+            source[NAME]: (
+                source.get("interval", self.sleep()),
+                source.get("jitter", 0),
+            )
+            for source in self.config["sources"]
+        }
+
     def operators(self):
         """Return a list of (name, Operator class, {kwargs}) tuples.
 
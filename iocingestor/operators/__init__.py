@@ -17,6 +17,11 @@ class Operator(ABC):
     When adding additional methods to child classes, consider prefixing the
     method name with an underscore to denote a ``_private_method``. Do not
     override other existing methods from this class.
+
+    Operators doing network I/O may instead define
+    ``async def process_batch(self, artifacts)``. The Ingestor awaits it on its
+    event loop, passing only the artifacts allowed by ``filter_artifacts``.
+    ``handle_artifact`` must still be defined, for use with ``process``.
     """
 
     def __init__(
@@ -78,8 +83,13 @@ class Operator(ABC):
 
         return True
 
+    def filter_artifacts(self, artifacts: List[Type[Artifact]]) -> List[Type[Artifact]]:
+        """Returns the artifacts allowed by this plugin's filters."""
+        return [
+            artifact for artifact in artifacts if self._artifact_is_allowed(artifact)
+        ]
+
     def process(self, artifacts: List[Type[Artifact]]):
         """Process all applicable artifacts."""
-        for artifact in artifacts:
-            if self._artifact_is_allowed(artifact):
-                self.handle_artifact(artifact)
+        for artifact in self.filter_artifacts(artifacts):
+            self.handle_artifact(artifact)
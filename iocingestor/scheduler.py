@@ -0,0 +1,82 @@
+import heapq
+import itertools
+import random
+import time
+from typing import Callable, Dict, List, Tuple
+
+
+class Scheduler:
+    """Decides when each source is due to run.
+
+    Sources are kept in a heap ordered by due time, so finding the due sources
+    doesn't depend on how many sources are configured.
+    """
+
+    def __init__(self, timefunc: Callable[[], float] = time.monotonic):
+        self.timefunc = timefunc
+        self.intervals: Dict[str, Tuple[float, float]] = {}
+        self._heap: List[Tuple[float, int, str]] = []
+        self._due: Dict[str, float] = {}
+        self._counter = itertools.count()
+
+    def _push(self, name: str, due: float):
+        self._due[name] = due
+        heapq.heappush(self._heap, (due, next(self._counter), name))
+
+    def add(self, name: str, interval: float, jitter: float = 0):
+        """Schedule a source to run now, then every ``interval`` seconds.
+
+        Each run is delayed by a random amount up to ``jitter`` seconds, to
+        spread out sources sharing the same interval.
+        """
+        self.intervals[name] = (interval, jitter)
+        self._push(name, self.timefunc())
+
+    def remove(self, name: str):
+        """Stop scheduling a source."""
+        self.intervals.pop(name, None)
+        # Stale heap entries are skipped when popped.
+        self._due.pop(name, None)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._due
+
+    def next_due(self) -> float:
+        """Returns the time the next source is due, or infinity if there is none."""
+        while self._heap:
+            due, _, name = self._heap[0]
+            if self._due.get(name) == due:
+                return due
+            heapq.heappop(self._heap)
+
+        return float("inf")
+
+    def pop_due(self) -> List[Tuple[str, float]]:
+        """Returns ``(name, due)`` for every source due now, unscheduling them.
+
+        Call ``reschedule`` for each of them once they have run.
+        """
+        now = self.timefunc()
+        due_list = []
+        while self.next_due() <= now:
+            due, _, name = heapq.heappop(self._heap)
+            del self._due[name]
+            due_list.append((name, due))
+
+        return due_list
+
+    def reschedule(self, name: str, due: float):
+        """Schedule the next run of a source that was due at ``due``.
+
+        Runs missed while the source was late are skipped rather than
+        caught up.
+        """
+        if name not in self.intervals:
+            return
+
+        interval, jitter = self.intervals[name]
+        next_due = max(due + interval, self.timefunc())
+        if jitter:
+            next_due += random.uniform(0, jitter)
+
+        self._push(name, next_due)
@@ -1,6 +1,6 @@
 from abc import ABC, abstractmethod
 from hashlib import md5
-from typing import List, Type
+from typing import Any, Generator, Iterable, List, Optional, Tuple, Type
 from urllib.parse import urlparse
 
 from ioc_finder import (
@@ -19,6 +19,7 @@ from pydantic import BaseModel
 
 from iocingestor.artifacts import URL, Artifact, Domain, Hash, IPAddress, Task
 from iocingestor.ioc_fanger import fang
+from iocingestor.sources import pool
 
 TRUNCATE_LENGTH = 280
 
@@ -34,10 +35,23 @@ class IoC(BaseModel):
         return self.urls + self.domains + self.ips + self.hashes
 
 
-def make_artifacts_unique(artifacts: List[Type[Artifact]]) -> List[Type[Artifact]]:
+ArtifactGenerator = Generator[Type[Artifact], None, Optional[str]]
+
+
+def unique_artifacts(artifacts: Iterable[Type[Artifact]]) -> ArtifactGenerator:
+    """Yield artifacts, skipping duplicates.
+
+    If ``artifacts`` is a generator, its return value (e.g. the saved state
+    from ``Source.iter_artifacts``) is passed through.
+    """
     memo = set()
-    artifacts_ = []
-    for artifact in artifacts:
+    iterator = iter(artifacts)
+    while True:
+        try:
+            artifact = next(iterator)
+        except StopIteration as stop:
+            return stop.value
+
         text = (
             artifact.artifact
             + artifact.source_name
@@ -47,11 +61,32 @@ def make_artifacts_unique(artifacts: List[Type[Artifact]]) -> List[Type[Artifact
         key = md5(text.encode()).hexdigest()
 
         if key not in memo:
-            artifacts_.append(artifact)
+            yield artifact
 
         memo.add(key)
 
-    return artifacts_
+
+def make_artifacts_unique(artifacts: List[Type[Artifact]]) -> List[Type[Artifact]]:
+    return list(unique_artifacts(artifacts))
+
+
+def stream_run(source: Any, saved_state: Optional[str]) -> ArtifactGenerator:
+    """Adapt a source's ``run`` to the ``iter_artifacts`` protocol."""
+    saved_state, artifacts = source.run(saved_state)
+    yield from artifacts
+    return saved_state
+
+
+def collect_artifacts(
+    artifacts: ArtifactGenerator,
+) -> Tuple[Optional[str], List[Type[Artifact]]]:
+    """Drain an ``iter_artifacts`` generator into ``(saved_state, list(Artifact))``."""
+    artifact_list = []
+    while True:
+        try:
+            artifact_list.append(next(artifacts))
+        except StopIteration as stop:
+            return stop.value, artifact_list
 
 
 def extract_iocs(content: str, strict=False) -> IoC:
@@ -108,9 +143,26 @@ class Source(ABC):
         assume this is a first run. If state is maintained by the remote
         resource (e.g. as it is with SQS), ``saved_state`` should always be
         ``None``.
+
+        Sources doing network I/O may define this as ``async def run`` instead,
+        in which case the Ingestor awaits it on its event loop rather than
+        running it on a worker thread. Keep CPU-heavy work such as
+        ``process_element`` short, or hand it to an executor, so the loop is
+        not blocked.
         """
         raise NotImplementedError()
 
+    def iter_artifacts(self, saved_state: str) -> ArtifactGenerator:
+        """Yield artifacts one at a time, then return ``saved_state``.
+
+        The Ingestor consumes sources through this method, handing artifacts to
+        operators in batches while extraction is still going on. The default
+        implementation wraps ``run``. Sources that can produce artifacts
+        incrementally should override it, and implement ``run`` as
+        ``collect_artifacts(self.iter_artifacts(saved_state))``.
+        """
+        return (yield from stream_run(self, saved_state))
+
     def nonobfuscated_iocs(self, content: str) -> IoC:
         return extract_iocs(content, strict=True)
 
@@ -146,6 +198,28 @@ class Source(ABC):
         :param reference_link: Reference link to attach to all artifacts.
         :param include_nonobfuscated: Include non-defanged URLs in output?
         """
+        return list(
+            self.iter_element(
+                content, reference_link, include_nonobfuscated=include_nonobfuscated
+            )
+        )
+
+    def iter_element(
+        self, content: str, reference_link: str, include_nonobfuscated: bool = False
+    ) -> Generator[Type[Artifact], None, None]:
+        """Take a single source content/url and yield Artifacts.
+
+        Generator version of ``process_element``, with the same parameters.
+        When the extraction pool is enabled, the work is done in a worker
+        process with the base class implementation.
+        """
+        if pool.is_enabled():
+            yield from pool.apply(
+                _process_element,
+                (self.name, content, reference_link, include_nonobfuscated),
+            )
+            return
+
         logger.debug(f"Processing in source '{self.name}'")
 
         # Truncate content to a reasonable length for reference_text.
@@ -153,8 +227,7 @@ class Source(ABC):
             "..." if len(content) > TRUNCATE_LENGTH else ""
         )
 
-        # Initialize an empty list and a map of counters to track each artifact type.
-        artifact_list: List[Type[Artifact]] = []
+        # Initialize a map of counters to track each artifact type.
         artifact_type_count = {
             "domain": 0,
             "hash": 0,
@@ -186,7 +259,7 @@ class Source(ABC):
                 pass
 
             # Do URL collection.
-            artifact_list.append(artifact)
+            yield artifact
             artifact_type_count["url"] += 1
 
         for domain in iocs.domains:
@@ -206,7 +279,7 @@ class Source(ABC):
                 pass
 
             # Do URL collection.
-            artifact_list.append(artifact)
+            yield artifact
             artifact_type_count["domain"] += 1
 
         for ip in iocs.ips:
@@ -231,7 +304,7 @@ class Source(ABC):
                 # Skip invalid IPs.
                 continue
 
-            artifact_list.append(artifact)
+            yield artifact
             artifact_type_count["ipaddress"] += 1
 
         # Collect hashes.
@@ -243,7 +316,7 @@ class Source(ABC):
                 reference_text=reference_text,
             )
 
-            artifact_list.append(artifact)
+            yield artifact
             artifact_type_count["hash"] += 1
 
         # Generate generic task.
@@ -252,9 +325,27 @@ class Source(ABC):
         artifact = Task(
             title, self.name, reference_link=reference_link, reference_text=description
         )
-        artifact_list.append(artifact)
+        yield artifact
         artifact_type_count["task"] += 1
 
-        logger.debug(f"Found {len(artifact_list)} total artifacts")
+        logger.debug(f"Found {sum(artifact_type_count.values())} total artifacts")
         logger.debug(f"Type breakdown: {artifact_type_count}")
-        return artifact_list
+
+
+class _PoolSource(Source):
+    """Stand-in source used to run ``process_element`` in pool workers."""
+
+    def __init__(self, name: str):
+        self.name = name
+
+    def run(self, saved_state: str):
+        raise NotImplementedError()
+
+
+def _process_element(
+    name: str, content: str, reference_link: str, include_nonobfuscated: bool
+) -> List[Type[Artifact]]:
+    """Entry point for ``process_element`` in extraction pool workers."""
+    return _PoolSource(name).process_element(
+        content, reference_link, include_nonobfuscated=include_nonobfuscated
+    )
@@ -3,7 +3,12 @@ from typing import List, Optional, Tuple, Type
 import jsonpath_rw
 
 from iocingestor.artifacts import Artifact
-from iocingestor.sources import Source, make_artifacts_unique
+from iocingestor.sources import (
+    ArtifactGenerator,
+    Source,
+    collect_artifacts,
+    unique_artifacts,
+)
 
 
 class AbstractPlugin(Source):
@@ -28,8 +33,13 @@ class AbstractPlugin(Source):
 
     def run(self, saved_state: str) -> Tuple[str, List[Type[Artifact]]]:
         """Run and return (saved_state, list(Artifact))"""
-        artifact_list = []
+        return collect_artifacts(self.iter_artifacts(saved_state))
 
+    def iter_artifacts(self, saved_state: str) -> ArtifactGenerator:
+        """Yield artifacts and return saved_state."""
+        return (yield from unique_artifacts(self._iter_contents(saved_state)))
+
+    def _iter_contents(self, saved_state: str) -> ArtifactGenerator:
         saved_state, content_list = self.get_objects(saved_state)
         for content in content_list:
             # Iterate over each piece of "content", extracting from every path of interest.
@@ -44,8 +54,8 @@ class AbstractPlugin(Source):
 
                 # Extract artifacts.
                 for match in matches:
-                    artifact_list += self.process_element(
+                    yield from self.iter_element(
                         match.value, reference, include_nonobfuscated=True
                     )
 
-        return saved_state, make_artifacts_unique(artifact_list)
+        return saved_state
@@ -0,0 +1,68 @@
+"""Shared process pool for CPU-bound IOC extraction.
+
+Fanging and the ``ioc_finder`` parsers are pure Python and hold the GIL, so
+running sources on threads doesn't spread extraction over several cores. When
+enabled, ``Source.process_element`` ships its work to this pool instead. The
+pool is created once and its workers are reused across cycles.
+"""
+import atexit
+import multiprocessing
+import multiprocessing.pool
+from typing import Any, Callable, Optional, Sequence
+
+from loguru import logger
+
+_pool: Optional[multiprocessing.pool.Pool] = None
+_processes = 0
+
+
+def _initializer():
+    """Make sure workers never try to hand work to a pool of their own."""
+    global _pool, _processes
+    _pool = None
+    _processes = 0
+
+
+def configure(processes: int):
+    """Start the extraction pool with the given number of worker processes.
+
+    An existing pool of the same size is kept, so warm workers survive config
+    reloads. ``0`` shuts the pool down and extraction runs in-process.
+    """
+    global _pool, _processes
+    if processes == _processes:
+        return
+
+    shutdown()
+    if processes > 0:
+        logger.debug(f"Starting extraction pool with {processes} processes")
+        context = multiprocessing.get_context("spawn")
+        _pool = context.Pool(processes, initializer=_initializer)
+        _processes = processes
+
+
+def shutdown():
+    """Stop the extraction pool, if running."""
+    global _pool, _processes
+    if _pool is not None:
+        _pool.terminate()
+        _pool.join()
+
+    _pool = None
+    _processes = 0
+
+
+def is_enabled() -> bool:
+    """Returns True if extraction should be handed to the pool."""
+    return _pool is not None
+
+
+def apply(func: Callable, args: Sequence) -> Any:
+    """Run ``func(*args)`` in a worker process and return the result."""
+    if _pool is None:
+        return func(*args)
+
+    return _pool.apply(func, args)
+
+
+atexit.register(shutdown)
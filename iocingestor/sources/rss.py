@@ -5,7 +5,12 @@ import feedparser
 from feedparser.datetimes import _parse_date
 
 from iocingestor.artifacts import Artifact
-from iocingestor.sources import Source, make_artifacts_unique
+from iocingestor.sources import (
+    ArtifactGenerator,
+    Source,
+    collect_artifacts,
+    unique_artifacts,
+)
 
 AFTERIOC = "Indicators of Compromise"
 
@@ -17,9 +22,14 @@ class Plugin(Source):
         self.feed_type = feed_type
 
     def run(self, saved_state: str) -> Tuple[str, List[Type[Artifact]]]:
+        return collect_artifacts(self.iter_artifacts(saved_state))
+
+    def iter_artifacts(self, saved_state: str) -> ArtifactGenerator:
+        return (yield from unique_artifacts(self._iter_items(saved_state)))
+
+    def _iter_items(self, saved_state: str) -> ArtifactGenerator:
         feed = feedparser.parse(self.url)
 
-        artifacts = []
         for item in list(reversed(feed["items"])):
             # Only new items.
             published_parsed = item.get("published_parsed") or item.get(
@@ -49,19 +59,19 @@ class Plugin(Source):
             text = ""
             if self.feed_type == "afterioc":
                 text = soup.get_text(separator=" ").split(AFTERIOC)[-1]
-                artifacts += self.process_element(
+                yield from self.iter_element(
                     text, item.get("link") or self.url, include_nonobfuscated=True
                 )
             elif self.feed_type == "clean":
                 text = soup.get_text(separator=" ")
-                artifacts += self.process_element(
+                yield from self.iter_element(
                     text, item.get("link") or self.url, include_nonobfuscated=True
                 )
             else:
                 # Default: self.feed_type == 'messy'.
                 text = soup.get_text(separator=" ")
-                artifacts += self.process_element(text, item.get("link") or self.url)
+                yield from self.iter_element(text, item.get("link") or self.url)
 
             saved_state = item.get("published") or item.get("updated")
 
-        return saved_state, make_artifacts_unique(artifacts)
+        return saved_state
@@ -4,7 +4,7 @@ import twitter
 from loguru import logger
 
 from iocingestor.artifacts import Artifact
-from iocingestor.sources import Source
+from iocingestor.sources import ArtifactGenerator, Source, collect_artifacts
 
 TWEET_URL = "https://twitter.com/{user}/status/{id}"
 
@@ -63,6 +63,9 @@ class Plugin(Source):
             self.endpoint = self.api.search.tweets
 
     def run(self, saved_state: str) -> Tuple[str, List[Type[Artifact]]]:
+        return collect_artifacts(self.iter_artifacts(saved_state))
+
+    def iter_artifacts(self, saved_state: str) -> ArtifactGenerator:
         # Modify kwargs to insert since_id.
         if saved_state:
             self.kwargs["since_id"] = saved_state
@@ -74,7 +77,7 @@ class Plugin(Source):
             # API error; log and return early.
             logger.warning(f"Twitter API Error: {e}")
 
-            return saved_state, []
+            return saved_state
 
         # Correctly handle responses from different endpoints.
         try:
@@ -92,7 +95,6 @@ class Plugin(Source):
             for s in tweet_list
         ]
 
-        artifacts: List[Type[Artifact]] = []
         # Traverse in reverse, old to new.
         tweets.reverse()
         for tweet in tweets:
@@ -108,10 +110,10 @@ class Plugin(Source):
 
             # Process tweet.
             saved_state = cast(str, tweet["id"])
-            artifacts += self.process_element(
+            yield from self.iter_element(
                 tweet["content"],
                 TWEET_URL.format(user=tweet["user"], id=tweet["id"]),
                 include_nonobfuscated=self.include_nonobfuscated,
             )
 
-        return saved_state, artifacts
+        return saved_state
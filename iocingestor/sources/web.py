@@ -3,7 +3,7 @@ from typing import List, Tuple, Type
 import requests
 
 from iocingestor.artifacts import Artifact
-from iocingestor.sources import Source
+from iocingestor.sources import ArtifactGenerator, Source, collect_artifacts
 
 
 class Plugin(Source):
@@ -12,6 +12,9 @@ class Plugin(Source):
         self.url = url
 
     def run(self, saved_state: str) -> Tuple[str, List[Type[Artifact]]]:
+        return collect_artifacts(self.iter_artifacts(saved_state))
+
+    def iter_artifacts(self, saved_state: str) -> ArtifactGenerator:
         # Read saved state and set HTTP headers.
         headers = {}
         if saved_state:
@@ -30,7 +33,7 @@ class Plugin(Source):
 
         # If not modified, return immediately.
         if response.status_code == 304:
-            return saved_state, []
+            return saved_state
 
         # Otherwise, do the full request.
         response = requests.get(self.url, headers=headers)
@@ -45,8 +48,8 @@ class Plugin(Source):
             saved_state = last_modified
 
         # Process text.
-        artifact_list = self.process_element(
+        yield from self.iter_element(
             response.text, self.url, include_nonobfuscated=True
         )
 
-        return saved_state, artifact_list
+        return saved_state
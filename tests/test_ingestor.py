@@ -1,7 +1,13 @@
+import asyncio
+import threading
 import unittest
 from unittest.mock import Mock, patch
 
 import iocingestor
+from iocingestor.artifacts import Domain
+from iocingestor.operators import Operator
+from iocingestor.scheduler import Scheduler
+from iocingestor.sources import Source
 
 
 class TestIngestor(unittest.TestCase):
@@ -20,6 +26,12 @@ class TestIngestor(unittest.TestCase):
         ]
 
         Config.return_value.state_path.return_value = ":memory:"
+        Config.return_value.max_source_workers.return_value = 2
+        Config.return_value.extraction_processes.return_value = 0
+        Config.return_value.artifact_batch_size.return_value = 2
+        Config.return_value.max_pending_batches.return_value = 1
+        Config.return_value.schedules.return_value = {"test-rss": (60, 0)}
+        Config.return_value.sleep.return_value = 900
         self.app = iocingestor.Ingestor("test")
         self.app.statedb = Mock()
 
@@ -38,6 +50,12 @@ class TestIngestor(unittest.TestCase):
         Config.return_value.configure_mock(**attrs)
 
         Config.return_value.state_path.return_value = ":memory:"
+        Config.return_value.max_source_workers.return_value = 1
+        Config.return_value.artifact_batch_size.return_value = 500
+        Config.return_value.max_pending_batches.return_value = 8
+        Config.return_value.extraction_processes.return_value = 0
+        Config.return_value.schedules.return_value = {}
+        Config.return_value.sleep.return_value = 900
 
         app = iocingestor.Ingestor("test")
         self.assertEqual(app.sources["test-twitter"].q, "test")
@@ -61,3 +79,97 @@ class TestIngestor(unittest.TestCase):
         self.app.statedb.save_state.assert_called()
         # should run 4 times, sources*operators.
         self.assertEqual(self.app.sources["test-twitter"].process.call_count, 4)
+
+    def test_run_once_runs_sources_concurrently(self):
+        barrier = threading.Barrier(2, timeout=5)
+
+        def run(saved_state):
+            # Both sources must be in flight at once to get past the barrier.
+            barrier.wait()
+            return saved_state, []
+
+        self.app.sources = {"test-twitter": Mock(), "test-rss": Mock()}
+        for source in self.app.sources.values():
+            source.run.side_effect = run
+
+        self.app.run_once()
+        self.assertEqual(self.app.statedb.save_state.call_count, 2)
+
+    def test_run_once_skips_failed_sources(self):
+        self.app.sources = {"test-twitter": Mock(), "test-rss": Mock()}
+        self.app.sources["test-twitter"].run.side_effect = Exception("boom")
+        self.app.sources["test-rss"].run.return_value = ("state", [])
+
+        self.app.run_once()
+        self.app.statedb.save_state.assert_called_once_with("test-rss", "state")
+
+    def test_run_once_awaits_async_plugins(self):
+        class AsyncSource:
+            async def run(self, saved_state):
+                await asyncio.sleep(0)
+                return "state", [Domain("example.com", "async")]
+
+        class AsyncOperator(Operator):
+            def __init__(self):
+                super().__init__(artifact_types=[Domain])
+                self.processed = []
+
+            def handle_artifact(self, artifact):
+                raise NotImplementedError()
+
+            async def process_batch(self, artifacts):
+                await asyncio.sleep(0)
+                self.processed += artifacts
+
+        operator = AsyncOperator()
+        self.app.sources = {"test-async": AsyncSource()}
+        self.app.operators = {"test-async": operator}
+
+        self.app.run_once()
+        self.app.statedb.save_state.assert_called_once_with("test-async", "state")
+        self.assertEqual([str(x) for x in operator.processed], ["example.com"])
+
+    def test_run_once_streams_artifacts_in_batches(self):
+        class StreamingSource(Source):
+            def __init__(self, name):
+                self.name = name
+
+            def run(self, saved_state):
+                raise NotImplementedError()
+
+            def iter_artifacts(self, saved_state):
+                for i in range(5):
+                    yield Domain(f"{i}.example.com", self.name)
+                return "state"
+
+        operator = Mock()
+        self.app.sources = {"test-stream": StreamingSource("test-stream")}
+        self.app.operators = {"test-operator": operator}
+
+        self.app.run_once()
+        # batch size is 2: 2 + 2 + 1
+        self.assertEqual(
+            [len(call[0][0]) for call in operator.process.call_args_list], [2, 2, 1]
+        )
+        self.app.statedb.save_state.assert_called_once_with("test-stream", "state")
+
+    def test_sources_are_scheduled_from_config(self):
+        self.assertEqual(
+            self.app.scheduler.intervals,
+            {"test-twitter": (900, 0), "test-rss": (60, 0)},
+        )
+
+    def test_run_pending_runs_due_sources(self):
+        now = [1000.0]
+        self.app.scheduler = Scheduler(timefunc=lambda: now[0])
+        self.app.scheduler.add("test-twitter", 900)
+        self.app.scheduler.add("test-rss", 60)
+
+        # Both sources are due on the first run; rss is due again first.
+        self.assertEqual(self.app.run_pending(), 60)
+        self.assertEqual(self.app.statedb.save_state.call_count, 2)
+
+        now[0] = 1060.0
+        self.assertEqual(self.app.run_pending(), 60)
+        self.app.statedb.save_state.assert_called_with("test-rss", 1)
+        self.assertEqual(self.app.statedb.save_state.call_count, 3)
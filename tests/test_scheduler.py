@@ -0,0 +1,61 @@
+import unittest
+
+from iocingestor.scheduler import Scheduler
+
+
+class TestScheduler(unittest.TestCase):
+    def setUp(self):
+        self.now = 0.0
+        self.scheduler = Scheduler(timefunc=lambda: self.now)
+
+    def test_sources_are_due_immediately(self):
+        self.scheduler.add("fast", 60)
+        self.scheduler.add("slow", 3600)
+
+        self.assertEqual(
+            sorted(name for name, _ in self.scheduler.pop_due()), ["fast", "slow"]
+        )
+        self.assertEqual(self.scheduler.pop_due(), [])
+        self.assertEqual(self.scheduler.next_due(), float("inf"))
+
+    def test_sources_run_on_their_own_interval(self):
+        self.scheduler.add("fast", 60)
+        self.scheduler.add("slow", 3600)
+        for name, due in self.scheduler.pop_due():
+            self.scheduler.reschedule(name, due)
+
+        self.assertEqual(self.scheduler.next_due(), 60)
+
+        runs = []
+        for self.now in range(0, 3601, 60):
+            for name, due in self.scheduler.pop_due():
+                runs.append(name)
+                self.scheduler.reschedule(name, due)
+
+        self.assertEqual(runs.count("fast"), 60)
+        self.assertEqual(runs.count("slow"), 1)
+
+    def test_late_runs_are_not_caught_up(self):
+        self.scheduler.add("fast", 60)
+        self.scheduler.pop_due()
+
+        self.now = 500
+        self.scheduler.reschedule("fast", 0)
+        self.assertEqual(self.scheduler.next_due(), 500)
+
+    def test_jitter_delays_runs(self):
+        self.scheduler.add("fast", 60, jitter=10)
+        self.scheduler.pop_due()
+        self.scheduler.reschedule("fast", 0)
+
+        self.assertGreaterEqual(self.scheduler.next_due(), 60)
+        self.assertLessEqual(self.scheduler.next_due(), 70)
+
+    def test_removed_sources_are_not_due(self):
+        self.scheduler.add("fast", 60)
+        self.scheduler.remove("fast")
+
+        self.assertNotIn("fast", self.scheduler)
+        self.assertEqual(self.scheduler.pop_due(), [])
+        self.scheduler.reschedule("fast", 0)
+        self.assertEqual(self.scheduler.next_due(), float("inf"))
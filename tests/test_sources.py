@@ -138,3 +138,39 @@ class TestSources(unittest.TestCase):
         content = "google[.]com bit[.]ly co[.]jp"
         artifact_list = self.source.process_element(content, "link")
         self.assertEqual(len(artifact_list), 4)
+
+    def test_iter_artifacts_wraps_run(self):
+        source = DummySource("test")
+        source.run = lambda saved_state: ("state", ["a", "b"])
+
+        saved_state, artifacts = iocingestor.sources.collect_artifacts(
+            source.iter_artifacts(None)
+        )
+        self.assertEqual(saved_state, "state")
+        self.assertEqual(artifacts, ["a", "b"])
+
+    def test_unique_artifacts_keeps_saved_state(self):
+        def iter_artifacts():
+            yield from self.source.iter_element("example[.]com", "link")
+            yield from self.source.iter_element("example[.]com", "link")
+            return "state"
+
+        saved_state, artifacts = iocingestor.sources.collect_artifacts(
+            iocingestor.sources.unique_artifacts(iter_artifacts())
+        )
+        self.assertEqual(saved_state, "state")
+        self.assertEqual(len(artifacts), 2)
+
+    def test_process_element_in_extraction_pool(self):
+        content = "hxxp://someurl.com/test 232.23.21.12"
+        expected = self.source.process_element(content, "link")
+
+        iocingestor.sources.pool.configure(1)
+        try:
+            self.assertTrue(iocingestor.sources.pool.is_enabled())
+            artifact_list = self.source.process_element(content, "link")
+        finally:
+            iocingestor.sources.pool.shutdown()
+
+        self.assertEqual(artifact_list, expected)
+        self.assertEqual(artifact_list[0].source_name, "test")